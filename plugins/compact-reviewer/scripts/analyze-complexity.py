@@ -18,7 +18,6 @@ Exit codes:
 
 import sys
 import re
-from dataclasses import dataclass, field
 from typing import List, Dict, Tuple
 
 # Color codes
@@ -28,14 +27,38 @@ CYAN = '\033[0;36m'
 NC = '\033[0m'  # No Color
 
 
-@dataclass
-class CircuitAnalysis:
-    name: str
-    line: int
-    operations: Dict[str, int] = field(default_factory=dict)
-    estimated_constraints: int = 0
-    breakdown: List[str] = field(default_factory=list)
-    optimizations: List[str] = field(default_factory=list)
+# Pattern: export? circuit name(...): ReturnType { ... }
+# Matched against the whole file, so the signature is kept to a single line.
+_CIRCUIT_RE = re.compile(
+    r'(?:export[^\S\n]+)?circuit[^\S\n]+(\w+)[^\S\n]*\([^)\n]*\)[^\S\n]*:[^\S\n]*[^{\n]+\{'
+)
+_BRACE_RE = re.compile(r'[{}]')
+
+# Constraint-generating operations counted in circuit bodies, matched in a
+# single pass; the named group that matched identifies the operation.
+_OPERATION_RE = re.compile(
+    r'(?P<hash>\b(?:persistentHash|persistentCommit|hash)\s*\()'
+    r'|(?P<sha256>\bsha256\s*\()'
+    r'|(?P<ec_mul>\becMul\s*\()'
+    r'|(?P<merkle>MerkleTree(?:Client)?<(?P<depth>\d+)>)'
+    # Comparisons (exclude type annotations like Uint<64>, Vector<10>)
+    r'|(?P<inequality>(?<!\w<)(?<!\w)[<>]=?(?!\d+>))'
+    r'|(?P<equality>==)'
+    # Loops - extract iteration count
+    r'|(?P<loop>for\s+\w+\s+in\s+(?P<start>\d+)\.\.(?P<end>\d+))'
+    # Collection accesses (exclude type declarations like Vector<N>[T])
+    r'|(?P<collection>(?<!<\d)(?<![A-Z])\[\w+\])'
+)
+
+# Operations whose match simply increments an ops counter
+_OPERATION_COUNTERS = {
+    'hash': 'hash_operations',
+    'sha256': 'sha256_operations',
+    'ec_mul': 'ec_operations',
+    'inequality': 'inequality_comparisons',
+    'equality': 'equality_comparisons',
+    'collection': 'collection_accesses',
+}
 
 
 # Constraint cost table from research.md
@@ -83,35 +106,30 @@ def parse_compact_file(filepath: str) -> str:
 def find_circuits(content: str) -> List[Tuple[str, int, str]]:
     """Find all circuit definitions and their bodies."""
     circuits = []
-    lines = content.split('\n')
-
-    # Pattern: export? circuit name(...): ReturnType { ... }
-    circuit_pattern = re.compile(
-        r'(?:export\s+)?circuit\s+(\w+)\s*\([^)]*\)\s*:\s*[^\{]+\{'
-    )
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        match = circuit_pattern.search(line)
-        if match:
-            circuit_name = match.group(1)
-            start_line = i + 1
-
-            # Find the matching closing brace
-            brace_count = line.count('{') - line.count('}')
-            body_lines = [line[match.end()-1:]]  # Start from opening brace
-
-            j = i + 1
-            while j < len(lines) and brace_count > 0:
-                body_lines.append(lines[j])
-                brace_count += lines[j].count('{') - lines[j].count('}')
-                j += 1
-
-            circuits.append((circuit_name, start_line, '\n'.join(body_lines)))
-            i = j
-        else:
-            i += 1
+    pos = 0
+    line_num = 1
+    line_pos = 0
+
+    while True:
+        match = _CIRCUIT_RE.search(content, pos)
+        if not match:
+            break
+
+        line_num += content.count('\n', line_pos, match.start())
+        line_pos = match.start()
+
+        # Find the matching closing brace, starting from the opening brace
+        body_start = match.end() - 1
+        body_end = len(content)
+        depth = 0
+        for brace in _BRACE_RE.finditer(content, body_start):
+            depth += 1 if brace.group() == '{' else -1
+            if depth == 0:
+                body_end = brace.end()
+                break
+
+        circuits.append((match.group(1), line_num, content[body_start:body_end]))
+        pos = body_end
 
     return circuits
 
@@ -130,34 +148,15 @@ def count_operations(body: str) -> Dict[str, int]:
         'collection_accesses': 0,
     }
 
-    # Hash operations
-    ops['hash_operations'] += len(re.findall(r'\bpersistentHash\s*\(', body))
-    ops['hash_operations'] += len(re.findall(r'\bpersistentCommit\s*\(', body))
-    ops['hash_operations'] += len(re.findall(r'\bhash\s*\(', body))
-
-    # SHA256 specifically
-    ops['sha256_operations'] += len(re.findall(r'\bsha256\s*\(', body))
-
-    # EC operations
-    ops['ec_operations'] += len(re.findall(r'\becMul\s*\(', body))
-
-    # Merkle operations
-    merkle_matches = re.findall(r'MerkleTree(?:Client)?<(\d+)>', body)
-    if merkle_matches:
-        ops['merkle_proofs'] += len(merkle_matches)
-        ops['merkle_depth'] = max(int(d) for d in merkle_matches)
-
-    # Comparisons (exclude type annotations like Uint<64>, Vector<10>)
-    ops['inequality_comparisons'] += len(re.findall(r'(?<!\w<)(?<!\w)[<>]=?(?!\d+>)', body))
-    ops['equality_comparisons'] += len(re.findall(r'==', body))
-
-    # Loops - try to extract iteration count
-    loop_matches = re.findall(r'for\s+\w+\s+in\s+(\d+)\.\.(\d+)', body)
-    for start, end in loop_matches:
-        ops['loop_iterations'] += int(end) - int(start)
-
-    # Collection accesses (exclude type declarations like Vector<N>[T])
-    ops['collection_accesses'] += len(re.findall(r'(?<!<\d)(?<![A-Z])\[\w+\]', body))
+    for match in _OPERATION_RE.finditer(body):
+        kind = match.lastgroup
+        if kind == 'merkle':
+            ops['merkle_proofs'] += 1
+            ops['merkle_depth'] = max(ops['merkle_depth'], int(match.group('depth')))
+        elif kind == 'loop':
+            ops['loop_iterations'] += int(match.group('end')) - int(match.group('start'))
+        else:
+            ops[_OPERATION_COUNTERS[kind]] += 1
 
     return ops
 
@@ -272,50 +271,37 @@ def main():
         print("No circuits found in file.")
         sys.exit(0)
 
-    print(f"{CYAN}Complexity Analysis:{NC} {filepath}")
-    print()
+    # Assemble the report and emit it with a single write
+    out = [f"{CYAN}Complexity Analysis:{NC} {filepath}", ""]
 
     total_project_constraints = 0
-    analyses = []
 
+    # Analyze and output each circuit in turn
     for circuit_name, line_num, body in circuits:
         ops = count_operations(body)
         estimated, breakdown = estimate_constraints(ops)
         optimizations = suggest_optimizations(ops, body)
-
-        analysis = CircuitAnalysis(
-            name=circuit_name,
-            line=line_num,
-            operations=ops,
-            estimated_constraints=estimated,
-            breakdown=breakdown,
-            optimizations=optimizations
-        )
-        analyses.append(analysis)
         total_project_constraints += estimated
 
-    # Output each circuit analysis
-    for analysis in analyses:
-        print(f"{YELLOW}Circuit:{NC} {analysis.name} (line {analysis.line})")
-        print(f"  Estimated constraints: ~{analysis.estimated_constraints:,}")
+        out.append(f"{YELLOW}Circuit:{NC} {circuit_name} (line {line_num})")
+        out.append(f"  Estimated constraints: ~{estimated:,}")
 
-        if analysis.breakdown:
-            print("  Breakdown:")
-            for item in analysis.breakdown:
-                print(f"    - {item}")
+        if breakdown:
+            out.append("  Breakdown:")
+            out.extend(f"    - {item}" for item in breakdown)
 
-        if analysis.optimizations:
-            print("  Optimization opportunities:")
-            for opt in analysis.optimizations:
-                print(f"    - {opt}")
+        if optimizations:
+            out.append("  Optimization opportunities:")
+            out.extend(f"    - {opt}" for opt in optimizations)
 
-        print()
+        out.append("")
 
     # Overall summary
     complexity = classify_complexity(total_project_constraints)
-    print(f"{GREEN}Overall complexity:{NC} {complexity} (~{total_project_constraints:,} estimated constraints)")
-    print()
-    print("Note: Estimates are heuristic-based. Actual constraint count requires compilation.")
+    out.append(f"{GREEN}Overall complexity:{NC} {complexity} (~{total_project_constraints:,} estimated constraints)")
+    out.append("")
+    out.append("Note: Estimates are heuristic-based. Actual constraint count requires compilation.")
+    sys.stdout.write('\n'.join(out) + '\n')
 
     sys.exit(0)
 
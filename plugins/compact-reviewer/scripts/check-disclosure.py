@@ -17,8 +17,11 @@ Exit codes:
 
 import sys
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import List, Set, Tuple
+from enum import IntEnum
+from operator import attrgetter
+from typing import Dict, List, Set, Tuple
 
 # Color codes for terminal output
 RED = '\033[0;31m'
@@ -26,21 +29,51 @@ GREEN = '\033[0;32m'
 YELLOW = '\033[0;33m'
 NC = '\033[0m'  # No Color
 
+# Pattern: witness name(): Type;
+# Matched against the whole file, so whitespace is restricted to [^\S\n] and
+# the bracketed parts exclude \n to keep each declaration on one line.
+_WITNESS_DECL_RE = re.compile(
+    r'witness[^\S\n]+(\w+)[^\S\n]*\([^)\n]*\)[^\S\n]*:[^\S\n]*(\w+(?:<[^>\n]+>)?)[^\S\n]*;'
+)
+
+# Types with low entropy (< 2^20 possible values):
+# Uint<1> through Uint<19>, Boolean (only 2 values), Enums (typically few variants)
+_LOW_ENTROPY_RE = re.compile(r'Uint<[1-9]>|Uint<1[0-9]>|Boolean|Enum<')
+
+# Ledger operations a witness value may flow into: .increment( .insert( ...
+_LEDGER_OP_RE = re.compile(r'\.(increment|decrement|write|push|set|insert)\(')
+
+# Witness-dependent control flow (timing leak potential). Matched against the
+# whole file, so whitespace is restricted to [^\S\n] to stay within one line.
+_CTRL_FLOW_RE = re.compile(r'if[^\S\n]+.*\bget_\w+[^\S\n]*\(\)')
+
+
+class Severity(IntEnum):
+    """Issue severity; lower values sort first."""
+    CRITICAL = 0
+    HIGH = 1
+    MEDIUM = 2
+
+
+# Indexed by Severity
+SEVERITY_ICONS = ("🔴", "🟠", "🟡")
+
 
 @dataclass
 class DisclosureIssue:
+    # Declared by hand rather than with dataclass(slots=True), which needs 3.10
+    __slots__ = ('line', 'description', 'severity')
+
     line: int
     description: str
-    severity: str  # "critical", "high", "medium"
+    severity: Severity
 
 
-def parse_compact_file(filepath: str) -> Tuple[str, List[str]]:
-    """Read and parse a Compact file into lines."""
+def parse_compact_file(filepath: str) -> str:
+    """Read a Compact file."""
     try:
         with open(filepath, 'r') as f:
-            content = f.read()
-            lines = content.split('\n')
-        return content, lines
+            return f.read()
     except FileNotFoundError:
         print(f"{RED}[FAIL]{NC} Disclosure Check: {filepath}")
         print("Error: File not found")
@@ -51,73 +84,110 @@ def parse_compact_file(filepath: str) -> Tuple[str, List[str]]:
         sys.exit(2)
 
 
-def find_witness_declarations(content: str) -> List[Tuple[str, int, str]]:
+def find_line_starts(content: str) -> List[int]:
+    """Return the offset at which each line of content starts."""
+    starts = [0]
+    pos = content.find('\n')
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = content.find('\n', pos + 1)
+    return starts
+
+
+def get_line(content: str, line_starts: List[int], line_num: int) -> str:
+    """Return the text of a 1-based line number, without its newline."""
+    start = line_starts[line_num - 1]
+    end = line_starts[line_num] - 1 if line_num < len(line_starts) else len(content)
+    return content[start:end]
+
+
+def find_witness_declarations(content: str, line_starts: List[int]) -> List[Tuple[str, int, str]]:
     """Find all witness declarations and their types."""
     witnesses = []
-    lines = content.split('\n')
-
-    # Pattern: witness name(): Type;
-    witness_pattern = re.compile(
-        r'witness\s+(\w+)\s*\([^)]*\)\s*:\s*(\w+(?:<[^>]+>)?)\s*;'
-    )
+    last_line = 0
 
-    for i, line in enumerate(lines, 1):
-        match = witness_pattern.search(line)
-        if match:
-            name, type_str = match.groups()
-            witnesses.append((name, i, type_str))
+    for match in _WITNESS_DECL_RE.finditer(content):
+        line_num = bisect_right(line_starts, match.start())
+        # Only the first declaration on each line counts
+        if line_num == last_line:
+            continue
+        last_line = line_num
+        name, type_str = match.groups()
+        witnesses.append((name, line_num, type_str))
 
     return witnesses
 
 
 def is_low_entropy_type(type_str: str) -> bool:
     """Check if a type has low entropy (< 2^20 possible values)."""
-    low_entropy_patterns = [
-        r'Uint<[1-9]>',       # Uint<1> through Uint<9>
-        r'Uint<1[0-9]>',      # Uint<10> through Uint<19>
-        r'Boolean',           # Only 2 values
-        r'Enum<',             # Enums typically have few variants
-    ]
+    return _LOW_ENTROPY_RE.search(type_str) is not None
 
-    for pattern in low_entropy_patterns:
-        if re.search(pattern, type_str):
-            return True
-
-    return False
 
+def check_control_flow(content: str, line_starts: List[int]) -> List[DisclosureIssue]:
+    """Check for witness-dependent control flow (timing leak potential)."""
+    issues = []
+    last_line = 0
+
+    for match in _CTRL_FLOW_RE.finditer(content):
+        line_num = bisect_right(line_starts, match.start())
+        # Report each line at most once
+        if line_num == last_line:
+            continue
+        last_line = line_num
+        issues.append(DisclosureIssue(
+            line=line_num,
+            description="Control flow depends on witness value - potential timing leak (AV-01)",
+            severity=Severity.HIGH
+        ))
 
-def find_witness_usages(content: str, witness_name: str) -> List[Tuple[int, str]]:
-    """Find all lines where a witness is used."""
-    usages = []
-    lines = content.split('\n')
+    return issues
 
-    # Match witness call: witness_name()
-    usage_pattern = re.compile(rf'\b{witness_name}\s*\(\s*\)')
 
-    for i, line in enumerate(lines, 1):
-        if usage_pattern.search(line):
-            usages.append((i, line.strip()))
+def check_disclosure_violations(content: str) -> List[DisclosureIssue]:
+    """Check for disclosure rule violations."""
+    # Regexes run over the whole file; line numbers are recovered from match
+    # offsets, so only lines containing a witness call are ever sliced out.
+    line_starts = find_line_starts(content)
 
-    return usages
+    # Fast path: no witness keyword means no declarations to find
+    if 'witness' not in content:
+        return check_control_flow(content, line_starts)
 
+    witnesses = find_witness_declarations(content, line_starts)
+    if not witnesses:
+        return check_control_flow(content, line_starts)
 
-def check_disclosure_violations(content: str, lines: List[str]) -> List[DisclosureIssue]:
-    """Check for disclosure rule violations."""
     issues = []
+    witness_types = {name: type_str for name, _, type_str in witnesses}
+
+    # Match any witness call on a single line: witness_name()
+    usage_pattern = re.compile(
+        r'\b(' + '|'.join(re.escape(name) for name in witness_types) + r')[^\S\n]*\([^\S\n]*\)'
+    )
 
-    witnesses = find_witness_declarations(content)
+    # Group calls by line, each witness at most once per line in order of appearance
+    usages: Dict[int, Dict[str, None]] = {}
+    for match in usage_pattern.finditer(content):
+        line_num = bisect_right(line_starts, match.start())
+        usages.setdefault(line_num, {})[match.group(1)] = None
 
-    for witness_name, decl_line, type_str in witnesses:
-        usages = find_witness_usages(content, witness_name)
+    for line_num, used in usages.items():
+        line_content = get_line(content, line_starts, line_num).strip()
+
+        ledger_ops = ()
+        if 'disclose' not in line_content:
+            ledger_ops = dict.fromkeys(m.group(1) for m in _LEDGER_OP_RE.finditer(line_content))
+
+        for witness_name in used:
+            type_str = witness_types[witness_name]
 
-        for line_num, line_content in usages:
             # Check for low-entropy witness in persistentHash
             if 'persistentHash' in line_content:
                 if is_low_entropy_type(type_str):
                     issues.append(DisclosureIssue(
                         line=line_num,
                         description=f"Low-entropy witness '{witness_name}' ({type_str}) used in persistentHash() - vulnerable to brute-force (AV-03/AV-06)",
-                        severity="critical"
+                        severity=Severity.CRITICAL
                     ))
 
             # Check for witness value in return without disclose
@@ -127,30 +197,18 @@ def check_disclosure_violations(content: str, lines: List[str]) -> List[Disclosu
                     issues.append(DisclosureIssue(
                         line=line_num,
                         description=f"Witness '{witness_name}' may flow to public output without disclose()",
-                        severity="high"
+                        severity=Severity.HIGH
                     ))
 
-            # Check for witness in ledger operations without proper handling
-            ledger_ops = ['increment', 'decrement', 'write', 'push', 'set', 'insert']
+            # Check for witness value used directly in ledger operations without disclose
             for op in ledger_ops:
-                if f'.{op}(' in line_content:
-                    # Check if witness value is used directly in ledger operation
-                    if witness_name in line_content and 'disclose' not in line_content:
-                        issues.append(DisclosureIssue(
-                            line=line_num,
-                            description=f"Witness '{witness_name}' used in ledger {op}() - verify disclosure intent",
-                            severity="medium"
-                        ))
-
-    # Check for witness-dependent control flow (timing leak potential)
-    for i, line in enumerate(lines, 1):
-        if re.search(r'if\s+.*\bget_\w+\s*\(\)', line):
-            issues.append(DisclosureIssue(
-                line=i,
-                description="Control flow depends on witness value - potential timing leak (AV-01)",
-                severity="high"
-            ))
+                issues.append(DisclosureIssue(
+                    line=line_num,
+                    description=f"Witness '{witness_name}' used in ledger {op}() - verify disclosure intent",
+                    severity=Severity.MEDIUM
+                ))
 
+    issues.extend(check_control_flow(content, line_starts))
     return issues
 
 
@@ -166,8 +224,8 @@ def main():
         print("Error: Not a .compact file")
         sys.exit(2)
 
-    content, lines = parse_compact_file(filepath)
-    issues = check_disclosure_violations(content, lines)
+    content = parse_compact_file(filepath)
+    issues = check_disclosure_violations(content)
 
     if not issues:
         print(f"{GREEN}[PASS]{NC} Disclosure Check: {filepath}")
@@ -175,20 +233,22 @@ def main():
         print("No disclosure issues detected.")
         sys.exit(0)
     else:
-        print(f"{YELLOW}[FAIL]{NC} Disclosure Check: {filepath}")
-        print()
-        print("Potential violations:")
-
-        # Sort by severity
-        severity_order = {"critical": 0, "high": 1, "medium": 2}
-        issues.sort(key=lambda x: severity_order.get(x.severity, 3))
-
-        for issue in issues:
-            severity_icon = {"critical": "🔴", "high": "🟠", "medium": "🟡"}.get(issue.severity, "⚪")
-            print(f"  - Line {issue.line}: {severity_icon} {issue.description}")
-
-        print()
-        print(f"Summary: {len(issues)} potential disclosure issues")
+        # Sort by severity, then line
+        issues.sort(key=attrgetter('severity', 'line'))
+
+        # Assemble the report and emit it with a single write
+        out = [
+            f"{YELLOW}[FAIL]{NC} Disclosure Check: {filepath}",
+            "",
+            "Potential violations:",
+        ]
+        out.extend(
+            f"  - Line {issue.line}: {SEVERITY_ICONS[issue.severity]} {issue.description}"
+            for issue in issues
+        )
+        out.append("")
+        out.append(f"Summary: {len(issues)} potential disclosure issues")
+        sys.stdout.write('\n'.join(out) + '\n')
         sys.exit(1)
 
 
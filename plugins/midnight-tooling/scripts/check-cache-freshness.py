@@ -14,6 +14,14 @@ CACHE_DIR = Path.home() / ".cache" / "midnight-tooling"
 METADATA_FILE = CACHE_DIR / "metadata.json"
 STALENESS_HOURS = 48
 
+# Python 3.11+ parses a trailing "Z" natively; older versions need "+00:00"
+if sys.version_info >= (3, 11):
+    parse_timestamp = datetime.fromisoformat
+else:
+    def parse_timestamp(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp that may use a "Z" UTC suffix."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 def get_cache_status() -> dict:
     """Check cache freshness and return status information."""
@@ -47,7 +55,7 @@ def get_cache_status() -> dict:
         return result
 
     try:
-        last_updated = datetime.fromisoformat(result["last_updated"].replace("Z", "+00:00"))
+        last_updated = parse_timestamp(result["last_updated"])
         now = datetime.now(timezone.utc)
         age = now - last_updated
         result["age_hours"] = round(age.total_seconds() / 3600, 1)
@@ -10,11 +10,25 @@ import re
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+HOME = Path.home()
+CACHE_DIR = HOME / ".cache" / "midnight-tooling"
+METADATA_FILE = CACHE_DIR / "metadata.json"
+
+# Common installation locations for the compact binary
+COMPACT_SEARCH_PATHS = (
+    HOME / ".compact" / "bin",
+    HOME / ".local" / "bin",
+    Path("/usr/local/bin"),
+)
+
 
 class Severity(Enum):
     OK = "ok"
@@ -46,8 +60,40 @@ class DiagnosticResult:
         }
 
 
+# Timeouts bound how long a hung binary can stall the run. Version probes
+# return almost instantly when healthy; Docker queries round-trip to the
+# daemon and get more headroom. Probes within a check, and checks that wait
+# on a prerequisite, still run back to back: the longest chain (docker
+# --version, docker info, then the proof server queries) is about 25s.
+VERSION_PROBE_TIMEOUT = 5
+DOCKER_QUERY_TIMEOUT = 10
+
+# Memoized command results keyed by argv; all probed commands are read-only
+# queries, so repeated probes within one run can share a single subprocess.
+_command_cache: dict[tuple, Future] = {}
+_command_cache_lock = threading.Lock()
+
+
 def run_command(cmd: list, timeout: int = 30) -> tuple[int, str, str]:
-    """Run a command and return (returncode, stdout, stderr)."""
+    """Run a command and return (returncode, stdout, stderr).
+
+    Results are cached per argv, and concurrent callers requesting the same
+    command wait on the first invocation instead of spawning their own.
+    """
+    key = tuple(cmd)
+    with _command_cache_lock:
+        future = _command_cache.get(key)
+        owner = future is None
+        if owner:
+            future = _command_cache[key] = Future()
+
+    if owner:
+        future.set_result(_run_command_uncached(cmd, timeout))
+    return future.result()
+
+
+def _run_command_uncached(cmd: list, timeout: int) -> tuple[int, str, str]:
+    """Run a command without consulting the cache."""
     try:
         result = subprocess.run(
             cmd,
@@ -66,7 +112,7 @@ def run_command(cmd: list, timeout: int = 30) -> tuple[int, str, str]:
 
 def check_node() -> DiagnosticResult:
     """Check Node.js installation and version."""
-    code, stdout, stderr = run_command(["node", "--version"])
+    code, stdout, stderr = run_command(["node", "--version"], timeout=VERSION_PROBE_TIMEOUT)
 
     if code != 0:
         return DiagnosticResult(
@@ -109,7 +155,7 @@ def check_node() -> DiagnosticResult:
 
 def check_docker() -> DiagnosticResult:
     """Check Docker installation and daemon status."""
-    code, stdout, stderr = run_command(["docker", "--version"])
+    code, stdout, stderr = run_command(["docker", "--version"], timeout=VERSION_PROBE_TIMEOUT)
 
     if code != 0:
         return DiagnosticResult(
@@ -122,7 +168,7 @@ def check_docker() -> DiagnosticResult:
         )
 
     # Check if Docker daemon is running
-    code, _, stderr = run_command(["docker", "info"])
+    code, _, stderr = run_command(["docker", "info"], timeout=DOCKER_QUERY_TIMEOUT)
     if code != 0:
         return DiagnosticResult(
             name="Docker",
@@ -144,7 +190,7 @@ def check_docker() -> DiagnosticResult:
 
 def check_compact_cli() -> DiagnosticResult:
     """Check Compact developer tools installation."""
-    code, stdout, stderr = run_command(["compact", "--version"])
+    code, stdout, stderr = run_command(["compact", "--version"], timeout=VERSION_PROBE_TIMEOUT)
 
     if code != 0:
         return DiagnosticResult(
@@ -166,11 +212,11 @@ def check_compact_cli() -> DiagnosticResult:
 
 def check_compact_compiler() -> DiagnosticResult:
     """Check Compact compiler installation."""
-    code, stdout, stderr = run_command(["compact", "compile", "--version"])
+    code, stdout, stderr = run_command(["compact", "compile", "--version"], timeout=VERSION_PROBE_TIMEOUT)
 
     if code != 0:
         # Check if CLI is installed but compiler isn't
-        cli_code, _, _ = run_command(["compact", "--version"])
+        cli_code, _, _ = run_command(["compact", "--version"], timeout=VERSION_PROBE_TIMEOUT)
         if cli_code == 0:
             return DiagnosticResult(
                 name="Compact Compiler",
@@ -203,7 +249,7 @@ def check_proof_server_image() -> DiagnosticResult:
     code, stdout, stderr = run_command([
         "docker", "images", "--format", "{{.Repository}}:{{.Tag}}",
         "midnightnetwork/proof-server"
-    ])
+    ], timeout=DOCKER_QUERY_TIMEOUT)
 
     if code != 0 or not stdout:
         return DiagnosticResult(
@@ -228,7 +274,7 @@ def check_proof_server_running() -> DiagnosticResult:
     code, stdout, stderr = run_command([
         "docker", "ps", "--filter", "ancestor=midnightnetwork/proof-server",
         "--format", "{{.Status}}"
-    ])
+    ], timeout=DOCKER_QUERY_TIMEOUT)
 
     if code != 0:
         return DiagnosticResult(
@@ -260,17 +306,10 @@ def check_path_contains_compact() -> DiagnosticResult:
     compact_path = shutil.which("compact")
 
     if not compact_path:
-        # Check common installation locations
-        home = Path.home()
-        possible_paths = [
-            home / ".compact" / "bin",
-            home / ".local" / "bin",
-            Path("/usr/local/bin"),
-        ]
-
+        # Check common installation locations (only needed when PATH lookup failed)
         found_at = None
-        for p in possible_paths:
-            if (p / "compact").exists():
+        for p in COMPACT_SEARCH_PATHS:
+            if os.path.isfile(os.path.join(p, "compact")):
                 found_at = p
                 break
 
@@ -301,10 +340,7 @@ def check_path_contains_compact() -> DiagnosticResult:
 
 def check_release_notes_cache() -> DiagnosticResult:
     """Check release notes cache freshness."""
-    cache_dir = Path.home() / ".cache" / "midnight-tooling"
-    metadata_file = cache_dir / "metadata.json"
-
-    if not metadata_file.exists():
+    if not METADATA_FILE.exists():
         return DiagnosticResult(
             name="Release Notes Cache",
             severity=Severity.WARNING,
@@ -315,11 +351,7 @@ def check_release_notes_cache() -> DiagnosticResult:
         )
 
     try:
-        import json
-        from datetime import datetime, timezone
-
-        with open(metadata_file) as f:
-            metadata = json.load(f)
+        metadata = json.loads(METADATA_FILE.read_bytes())
 
         last_updated = datetime.fromisoformat(metadata["lastUpdated"].replace("Z", "+00:00"))
         age_hours = (datetime.now(timezone.utc) - last_updated).total_seconds() / 3600
@@ -352,39 +384,64 @@ def check_release_notes_cache() -> DiagnosticResult:
 
 def run_all_diagnostics() -> list[DiagnosticResult]:
     """Run all diagnostic checks."""
+    # (check, result name, prerequisite result name). A dependent check is
+    # skipped when its prerequisite failed, since its probes would fail too.
     checks = [
-        check_node,
-        check_docker,
-        check_compact_cli,
-        check_compact_compiler,
-        check_path_contains_compact,
-        check_proof_server_image,
-        check_proof_server_running,
-        check_release_notes_cache,
+        (check_node, "Node.js", None),
+        (check_docker, "Docker", None),
+        (check_compact_cli, "Compact CLI", None),
+        (check_compact_compiler, "Compact Compiler", "Compact CLI"),
+        (check_path_contains_compact, "PATH Configuration", None),
+        (check_proof_server_image, "Proof Server Image", "Docker"),
+        (check_proof_server_running, "Proof Server Status", "Docker"),
+        (check_release_notes_cache, "Release Notes Cache", None),
     ]
 
-    results = []
-    for check in checks:
+    def run_check(check, name, depends_on) -> DiagnosticResult:
+        if depends_on is not None:
+            prerequisite = futures[depends_on].result()
+            if prerequisite.severity in (Severity.CRITICAL, Severity.ERROR):
+                return DiagnosticResult(
+                    name=name,
+                    severity=Severity.INFO,
+                    message=f"Skipped: {depends_on} unavailable"
+                )
+
         try:
-            results.append(check())
+            return check()
         except Exception as e:
-            results.append(DiagnosticResult(
+            return DiagnosticResult(
                 name=check.__name__,
                 severity=Severity.ERROR,
                 message=f"Check failed with error: {e}"
-            ))
+            )
 
-    return results
+    # Checks are I/O-bound (mostly subprocess calls), so run them concurrently.
+    # Every check gets its own worker, so dependents can safely block on the
+    # prerequisite's future, which is always submitted before them.
+    futures: dict[str, Future] = {}
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        for check, name, depends_on in checks:
+            futures[name] = executor.submit(run_check, check, name, depends_on)
+
+    return [future.result() for future in futures.values()]
 
 
 def main():
     results = run_all_diagnostics()
 
-    # Categorize results
-    critical = [r for r in results if r.severity == Severity.CRITICAL]
-    errors = [r for r in results if r.severity == Severity.ERROR]
-    warnings = [r for r in results if r.severity == Severity.WARNING]
-    ok = [r for r in results if r.severity == Severity.OK]
+    # Categorize results in a single pass
+    buckets = {severity: [] for severity in Severity}
+    fixes_available = []
+    for r in results:
+        buckets[r.severity].append(r)
+        if r.fix_available:
+            fixes_available.append(r.name)
+
+    critical = buckets[Severity.CRITICAL]
+    errors = buckets[Severity.ERROR]
+    warnings = buckets[Severity.WARNING]
+    ok = buckets[Severity.OK]
 
     output = {
         "summary": {
@@ -395,7 +452,8 @@ def main():
             "total": len(results)
         },
         "results": [r.to_dict() for r in results],
-        "fixes_available": [r.to_dict() for r in results if r.fix_available]
+        # Names of results with a fix; full details are in "results"
+        "fixes_available": fixes_available
     }
 
     print(json.dumps(output, indent=2))
@@ -5,8 +5,10 @@ Supports filtering by component and version range.
 """
 
 import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -30,17 +32,52 @@ COMPONENT_DIRS = {
     "dapp-connector-api": "dapp-connector-api",
 }
 
+# Release notes filenames like: compact-0-26-0.mdx, minokawa-0-18-26-0.mdx
+_VERSION_FILENAME_PATTERNS = [
+    re.compile(r'(\d+)-(\d+)-(\d+)\.mdx$'),  # Simple: 0-26-0.mdx
+    re.compile(r'(\d+)-(\d+)-(\d+)-(\d+)\.mdx$'),  # With language version: 0-18-26-0.mdx
+]
+
+_TITLE_RE = re.compile(r'^title:\s*(.+)$', re.MULTILINE)
+
+# Section headings, in priority order; the named group that matched
+# identifies the heading (see _HEADING_SECTIONS)
+_HEADING_RE = re.compile(
+    r'##\s*(?P<summary>Summary)'
+    r'|##.*(?P<breaking>breaking)'
+    r'|##.*(?P<new_feature>new\s*feature)'
+    r'|###.*(?P<new>new)'
+    r'|##.*(?P<bug_fix>bug\s*fix)'
+    r'|###.*(?P<fix>fix)'
+    r'|(?P<other>##\s)',
+    re.IGNORECASE
+)
+
+# "Summary of changes" heading; its block is the fallback summary
+_SUMMARY_OF_CHANGES_RE = re.compile(r'##\s*Summary of changes\s*$')
+
+_HEADING_SECTIONS = {
+    "summary": "summary",
+    "breaking": "breaking",
+    "new_feature": "features",
+    "new": "features",
+    "bug_fix": "fixes",
+    "fix": "fixes",
+    "other": None,
+}
+
+# Bullet-point items collected for each section
+_SECTION_ITEMS = {
+    "breaking": "breaking_changes",
+    "features": "new_features",
+    "fixes": "bug_fixes",
+}
+
 
 def parse_version_from_filename(filename: str) -> Optional[str]:
     """Extract version from release notes filename."""
-    # Patterns like: compact-0-26-0.mdx, minokawa-0-18-26-0.mdx
-    patterns = [
-        r'(\d+)-(\d+)-(\d+)\.mdx$',  # Simple: 0-26-0.mdx
-        r'(\d+)-(\d+)-(\d+)-(\d+)\.mdx$',  # With language version: 0-18-26-0.mdx
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, filename)
+    for pattern in _VERSION_FILENAME_PATTERNS:
+        match = pattern.search(filename)
         if match:
             groups = match.groups()
             if len(groups) == 3:
@@ -64,84 +101,98 @@ def extract_changelog_sections(content: str) -> dict:
     }
 
     # Extract title from frontmatter
-    title_match = re.search(r'^title:\s*(.+)$', content, re.MULTILINE)
+    title_match = _TITLE_RE.search(content)
     if title_match:
         result["title"] = title_match.group(1).strip()
 
     # Look for common section headers
-    lines = content.split('\n')
+    lines = content.splitlines()
     current_section = None
     section_content = []
+    # Lines of the first "Summary of changes" block, up to the next ## heading
+    changes_block = None
+    in_changes_block = False
 
     for line in lines:
-        # Check for section headers
-        if re.match(r'^##\s*Summary', line, re.IGNORECASE):
-            current_section = "summary"
-            section_content = []
-        elif re.match(r'^##.*breaking', line, re.IGNORECASE):
-            current_section = "breaking"
-            section_content = []
-        elif re.match(r'^##.*new\s*feature', line, re.IGNORECASE) or re.match(r'^###.*new', line, re.IGNORECASE):
-            current_section = "features"
+        if in_changes_block:
+            if line.startswith('##'):
+                in_changes_block = False
+            else:
+                changes_block.append(line)
+        elif changes_block is None and 'Summary of changes' in line and _SUMMARY_OF_CHANGES_RE.search(line):
+            changes_block = []
+            in_changes_block = True
+
+        # Check for section headers (only lines starting with ## can match)
+        heading_match = _HEADING_RE.match(line) if line.startswith('##') else None
+        if heading_match:
+            current_section = _HEADING_SECTIONS[heading_match.lastgroup]
             section_content = []
-        elif re.match(r'^##.*bug\s*fix', line, re.IGNORECASE) or re.match(r'^###.*fix', line, re.IGNORECASE):
-            current_section = "fixes"
-            section_content = []
-        elif re.match(r'^##\s', line):
-            # New section, save previous
-            current_section = None
         elif current_section:
-            # Extract bullet points
-            bullet_match = re.match(r'^[-*]\s+(.+)$', line.strip())
-            if bullet_match:
-                item = bullet_match.group(1).strip()
-                if current_section == "breaking":
-                    result["breaking_changes"].append(item)
-                elif current_section == "features":
-                    result["new_features"].append(item)
-                elif current_section == "fixes":
-                    result["bug_fixes"].append(item)
-            elif current_section == "summary" and line.strip():
+            # Extract bullet points: "- item" or "* item"
+            stripped = line.strip()
+            if len(stripped) > 1 and stripped[0] in '-*' and stripped[1].isspace():
+                item = stripped[1:].strip()
+                if current_section in _SECTION_ITEMS:
+                    result[_SECTION_ITEMS[current_section]].append(item)
+            elif current_section == "summary" and stripped:
                 if not result["summary"]:
-                    result["summary"] = line.strip()
+                    result["summary"] = stripped
 
-    # If no structured sections found, try to extract from "Summary of changes"
-    summary_match = re.search(r'##\s*Summary of changes\s*\n([\s\S]*?)(?=\n##|\Z)', content)
-    if summary_match and not result["summary"]:
-        result["summary"] = summary_match.group(1).strip()[:500]
+    # If no structured sections found, fall back to the "Summary of changes" block
+    if changes_block is not None and not result["summary"]:
+        result["summary"] = '\n'.join(changes_block).strip()[:500]
 
     return result
 
 
+def read_release(path: str, filename: str, version: str) -> dict:
+    """Read and parse a single release notes file."""
+    try:
+        with open(path, 'rb') as f:
+            content = f.read().decode()
+        changelog = extract_changelog_sections(content)
+        return {
+            "file": filename,
+            "version": version,
+            "changelog": changelog
+        }
+    except Exception as e:
+        return {
+            "file": filename,
+            "version": version,
+            "error": str(e)
+        }
+
+
 def get_component_releases(component: str) -> list[dict]:
     """Get all releases for a component."""
     component_key = component.lower().replace(' ', '-')
     component_dir = COMPONENT_DIRS.get(component_key, component_key)
 
-    releases_dir = CACHE_DIR / component_dir
-    if not releases_dir.exists():
+    # Dot-files (e.g. macOS ._* metadata) are not release notes. A missing or
+    # unreadable directory simply has no releases.
+    try:
+        with os.scandir(CACHE_DIR / component_dir) as it:
+            mdx_files = [
+                entry for entry in it
+                if entry.name.endswith('.mdx') and not entry.name.startswith('.') and entry.is_file()
+            ]
+    except OSError:
         return []
 
-    releases = []
-    for mdx_file in sorted(releases_dir.glob("*.mdx"), reverse=True):
+    candidates = []
+    for mdx_file in sorted(mdx_files, key=lambda entry: entry.name, reverse=True):
         version = parse_version_from_filename(mdx_file.name)
         if version:
-            try:
-                content = mdx_file.read_text()
-                changelog = extract_changelog_sections(content)
-                releases.append({
-                    "file": mdx_file.name,
-                    "version": version,
-                    "changelog": changelog
-                })
-            except Exception as e:
-                releases.append({
-                    "file": mdx_file.name,
-                    "version": version,
-                    "error": str(e)
-                })
-
-    return releases
+            candidates.append((mdx_file.path, mdx_file.name, version))
+
+    if not candidates:
+        return []
+
+    # Overlap file reads; map() keeps releases in newest-first order
+    with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+        return list(executor.map(lambda c: read_release(*c), candidates))
 
 
 def list_available_components() -> list[str]:
@@ -150,11 +201,17 @@ def list_available_components() -> list[str]:
         return []
 
     components = []
-    for item in CACHE_DIR.iterdir():
-        if item.is_dir() and not item.name.startswith('.'):
-            # Check if it has any .mdx files
-            if list(item.glob("*.mdx")):
-                components.append(item.name)
+    with os.scandir(CACHE_DIR) as it:
+        for item in it:
+            if item.is_dir() and not item.name.startswith('.'):
+                # Check if it has any .mdx files; unreadable directories have none
+                try:
+                    with os.scandir(item.path) as sub:
+                        has_mdx = any(f.name.endswith('.mdx') and not f.name.startswith('.') for f in sub)
+                except OSError:
+                    has_mdx = False
+                if has_mdx:
+                    components.append(item.name)
 
     return sorted(components)
 
@@ -5,13 +5,60 @@ Outputs JSON with component versions.
 """
 
 import json
+import os
 import re
 import sys
 from pathlib import Path
+from typing import Optional
 
 CACHE_DIR = Path.home() / ".cache" / "midnight-tooling"
 SUPPORT_MATRIX_FILE = CACHE_DIR / "release-notes" / "support-matrix.mdx"
 
+# Markdown table rows like: | Runtime & Contracts | Compactc | 0.26.0 | Contract compiler |
+# Whitespace around each cell is excluded from the groups ([^\S\n] keeps
+# matches on a single line), so the captured cells are already stripped.
+_CELL = r'[^\S\n]*([^|\n]*?)[^\S\n]*\|'
+_TABLE_ROW_RE = re.compile(r'^\|' + _CELL * 4, re.MULTILINE)
+
+# Parsed components, keyed on the support matrix's mtime and size
+PARSED_CACHE_FILE = CACHE_DIR / "support-matrix.parsed.json"
+# Bump whenever parsing changes so caches written by older versions are ignored
+PARSED_CACHE_VERSION = 2
+
+
+def load_parsed_cache(stat: os.stat_result) -> Optional[dict]:
+    """Return cached components if they were parsed from the current file."""
+    try:
+        with open(PARSED_CACHE_FILE, "rb") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("version") != PARSED_CACHE_VERSION:
+        return None
+    if cached.get("mtime_ns") != stat.st_mtime_ns or cached.get("size") != stat.st_size:
+        return None
+    return cached.get("components")
+
+
+def save_parsed_cache(stat: os.stat_result, components: dict) -> None:
+    """Atomically write parsed components to the cache; failures are ignored."""
+    tmp_file = PARSED_CACHE_FILE.with_name(f"{PARSED_CACHE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump({
+                "version": PARSED_CACHE_VERSION,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "components": components
+            }, f)
+        os.replace(tmp_file, PARSED_CACHE_FILE)
+    except OSError:
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
 
 def parse_support_matrix() -> dict:
     """Parse support-matrix.mdx and extract version information."""
@@ -22,29 +69,31 @@ def parse_support_matrix() -> dict:
         "source_file": str(SUPPORT_MATRIX_FILE)
     }
 
-    if not SUPPORT_MATRIX_FILE.exists():
+    try:
+        stat = SUPPORT_MATRIX_FILE.stat()
+    except FileNotFoundError:
         result["error"] = f"Support matrix not found at {SUPPORT_MATRIX_FILE}. Run /midnight:sync-releases first."
         return result
+    except OSError as e:
+        result["error"] = f"Failed to read support matrix: {e}"
+        return result
+
+    cached_components = load_parsed_cache(stat)
+    if cached_components:
+        result["components"] = cached_components
+        result["success"] = True
+        return result
 
     try:
-        content = SUPPORT_MATRIX_FILE.read_text()
+        content = SUPPORT_MATRIX_FILE.read_bytes().decode()
     except IOError as e:
         result["error"] = f"Failed to read support matrix: {e}"
         return result
 
-    # Parse the markdown table
-    # Looking for lines like: | Runtime & Contracts | Compactc | 0.26.0 | Contract compiler |
-    table_pattern = re.compile(
-        r'\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|'
-    )
-
+    # Parse the markdown table rows in one pass over the file
     current_area = ""
-    for line in content.split('\n'):
-        match = table_pattern.match(line)
-        if not match:
-            continue
-
-        area, component, version, notes = [g.strip() for g in match.groups()]
+    for match in _TABLE_ROW_RE.finditer(content):
+        area, component, version, notes = match.groups()
 
         # Skip header rows
         if area in ('**Functional Area**', '---', ''):
@@ -79,6 +128,7 @@ def parse_support_matrix() -> dict:
 
     if result["components"]:
         result["success"] = True
+        save_parsed_cache(stat, result["components"])
     else:
         result["error"] = "No components found in support matrix"
 
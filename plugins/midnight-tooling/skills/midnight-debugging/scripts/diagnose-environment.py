@@ -19,17 +19,12 @@ def main():
         print(f"Error: doctor.py not found at {DOCTOR_SCRIPT}")
         sys.exit(1)
 
+    # Inherit stdout/stderr so output streams straight through without buffering
     result = subprocess.run(
         [sys.executable, str(DOCTOR_SCRIPT)],
-        capture_output=True,
-        text=True
+        stdin=subprocess.DEVNULL
     )
 
-    # Pass through the output
-    print(result.stdout)
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
-
     sys.exit(result.returncode)
 
 
@@ -7,10 +7,11 @@ Outputs JSON with comprehensive status information.
 import json
 import platform
 import re
-import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -18,44 +19,49 @@ from typing import Optional
 class ToolCheck:
     name: str
     command: str
-    version_command: str
+    version_command: list[str]
     required: bool
     min_version: Optional[str] = None
 
 
 TOOLS = [
-    ToolCheck("Node.js", "node", "node --version", True, "18.0.0"),
-    ToolCheck("npm", "npm", "npm --version", True, "9.0.0"),
-    ToolCheck("Git", "git", "git --version", True, "2.0.0"),
-    ToolCheck("Docker", "docker", "docker --version", True, "20.0.0"),
-    ToolCheck("Compact CLI", "compact", "compact --version", True),
-    ToolCheck("Compact Compiler", "compact", "compact compile --version", True),
-    ToolCheck("Yarn", "yarn", "yarn --version", False),
-    ToolCheck("Bun", "bun", "bun --version", False),
+    ToolCheck("Node.js", "node", ["node", "--version"], True, "18.0.0"),
+    ToolCheck("npm", "npm", ["npm", "--version"], True, "9.0.0"),
+    ToolCheck("Git", "git", ["git", "--version"], True, "2.0.0"),
+    ToolCheck("Docker", "docker", ["docker", "--version"], True, "20.0.0"),
+    ToolCheck("Compact CLI", "compact", ["compact", "--version"], True),
+    ToolCheck("Compact Compiler", "compact", ["compact", "compile", "--version"], True),
+    ToolCheck("Yarn", "yarn", ["yarn", "--version"], False),
+    ToolCheck("Bun", "bun", ["bun", "--version"], False),
 ]
 
+_VERSION_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)')
 
-def run_command(cmd: str, timeout: int = 10) -> tuple[int, str]:
-    """Run a shell command and return (returncode, output)."""
+
+def run_command(cmd: list[str], timeout: int = 10) -> tuple[Optional[int], str]:
+    """Run a command and return (returncode, output); returncode is None if it can't be executed."""
     try:
         result = subprocess.run(
             cmd,
-            shell=True,
             capture_output=True,
             text=True,
             timeout=timeout
         )
         output = result.stdout.strip() or result.stderr.strip()
         return result.returncode, output
+    except (FileNotFoundError, PermissionError):
+        # Not on PATH, or not executable
+        return None, "command not found"
     except subprocess.TimeoutExpired:
         return -1, "timeout"
     except Exception as e:
         return -1, str(e)
 
 
+@lru_cache(maxsize=64)
 def parse_version(version_string: str) -> Optional[tuple]:
     """Parse version string into tuple for comparison."""
-    match = re.search(r'(\d+)\.(\d+)\.(\d+)', version_string)
+    match = _VERSION_RE.search(version_string)
     if match:
         return tuple(int(g) for g in match.groups())
     return None
@@ -85,13 +91,12 @@ def check_tool(tool: ToolCheck) -> dict:
         "status": "missing"
     }
 
-    # Check if command exists
-    if not shutil.which(tool.command):
+    # Get version; a missing command is detected from the exec attempt itself
+    code, output = run_command(tool.version_command)
+    if code is None:
         result["status"] = "missing" if tool.required else "optional_missing"
         return result
 
-    # Get version
-    code, output = run_command(tool.version_command)
     if code == 0 and output:
         result["installed"] = True
         # Extract version number
@@ -125,7 +130,7 @@ def check_docker_running() -> dict:
         "status": "not_running"
     }
 
-    code, output = run_command("docker info")
+    code, output = run_command(["docker", "info"])
     if code == 0:
         result["running"] = True
         result["status"] = "running"
@@ -142,7 +147,7 @@ def check_proof_server_image() -> dict:
         "status": "not_pulled"
     }
 
-    code, output = run_command("docker images midnightnetwork/proof-server --format '{{.Tag}}'")
+    code, output = run_command(["docker", "images", "midnightnetwork/proof-server", "--format", "{{.Tag}}"])
     if code == 0 and output:
         result["available"] = True
         result["tags"] = output.split('\n')
@@ -151,6 +156,26 @@ def check_proof_server_image() -> dict:
     return result
 
 
+def check_services() -> dict:
+    """Check Docker services; the image check is skipped when the daemon is down."""
+    docker_daemon = check_docker_running()
+
+    if docker_daemon["running"]:
+        proof_server_image = check_proof_server_image()
+    else:
+        proof_server_image = {
+            "name": "Proof Server Image",
+            "available": False,
+            "tags": [],
+            "status": "daemon_not_running"
+        }
+
+    return {
+        "docker_daemon": docker_daemon,
+        "proof_server_image": proof_server_image
+    }
+
+
 def main():
     results = {
         "platform": {
@@ -170,9 +195,14 @@ def main():
         }
     }
 
+    # Tool and service checks are independent subprocess calls, so run them
+    # concurrently; map() keeps the tool results in TOOLS order.
+    with ThreadPoolExecutor(max_workers=len(TOOLS) + 1) as executor:
+        services = executor.submit(check_services)
+        tool_checks = list(executor.map(check_tool, TOOLS))
+
     # Check tools
-    for tool in TOOLS:
-        check = check_tool(tool)
+    for check in tool_checks:
         results["tools"].append(check)
 
         if check["required"]:
@@ -189,8 +219,7 @@ def main():
                 results["summary"]["optional_missing"] += 1
 
     # Check services
-    results["services"]["docker_daemon"] = check_docker_running()
-    results["services"]["proof_server_image"] = check_proof_server_image()
+    results["services"] = services.result()
 
     # Overall status
     results["ready"] = (